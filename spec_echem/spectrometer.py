@@ -5,21 +5,63 @@ Author: Dean Waldow
 Updated: 07-02-2025
 """
 
-import os
-import platform
-import sys
 import time
-import matplotlib.pyplot as plt
+import queue
+import logging
+import threading
+import ctypes
 import numpy as np
-import pandas as pd
-import math
-from pathlib import Path
-import pickle
-import warnings
-import json
-from datetime import datetime
 from avaspec import *
 from . import globals
+from . import kernels
+
+log = logging.getLogger(__name__)
+
+# Trimmed spectral range used for spectroelectrochemistry (nm)
+_WL_LO_NM = 380.0
+_WL_HI_NM = 1100.0
+
+# Default pixel bounds of the trimmed range, used until the device
+# wavelength calibration is read in init()
+_WL_LO = 395
+_WL_HI = 1660
+
+
+def _build_measconfig_template():
+    """
+    Build the module-level measurement-configuration template.
+
+    All device-independent fields are set once at import; instances copy
+    the template with a single memcpy instead of repeating 18 ctypes
+    attribute writes per init().
+
+    Returns:
+        MeasConfigType: Template with default measurement settings
+    """
+    measconfig = MeasConfigType()
+    measconfig.m_StartPixel = 0
+    measconfig.m_StopPixel = 0  # Patched per device from the pixel count
+    measconfig.m_IntegrationTime = 0.022  # Initial integration time (ms)
+    measconfig.m_IntegrationDelay = 0
+    measconfig.m_NrAverages = 200  # Default number of averages
+    measconfig.m_CorDynDark_m_Enable = 0
+    measconfig.m_CorDynDark_m_ForgetPercentage = 0
+    measconfig.m_Smoothing_m_SmoothPix = 0
+    measconfig.m_Smoothing_m_SmoothModel = 0
+    measconfig.m_SaturationDetection = 0
+    measconfig.m_Trigger_m_Mode = 0
+    measconfig.m_Trigger_m_Source = 0
+    measconfig.m_Trigger_m_SourceType = 0
+    measconfig.m_Control_m_StrobeControl = 0
+    measconfig.m_Control_m_LaserDelay = 0
+    measconfig.m_Control_m_LaserWidth = 0
+    measconfig.m_Control_m_LaserWaveLength = 0.0
+    measconfig.m_Control_m_StoreToRam = 0
+
+    return measconfig
+
+
+_DEFAULT_MEASCONFIG = _build_measconfig_template()
 
 
 class AvantesSpectrometer:
@@ -30,15 +72,42 @@ class AvantesSpectrometer:
     optimized for spectroelectrochemistry measurements with wavelength
     range approximately 380 to 1100 nm.
     """
-    
-    def __init__(self):
-        """Initialize the Avantes spectrometer instance."""
+
+    __slots__ = ('dev_handle', 'pixels', 'wavelength', 'serial_number',
+                 'measconfig', '_roi', '_n_roi', '_wavelength_trimmed',
+                 '_spec_buf', '_spec_view', '_dtype',
+                 '_ring', '_cb_func', '_fig', '_ax', '_line', '_bg', '_dirty',
+                 '_raw_devinfo')
+
+    def __init__(self, dtype=np.float32):
+        """
+        Initialize the Avantes spectrometer instance.
+
+        Args:
+            dtype: Storage dtype for returned spectra. The ADC is 16-bit,
+                so the float32 default loses no information and halves
+                memory bandwidth; pass np.float64 to opt out.
+        """
+        self._dtype = np.dtype(dtype)
         self.dev_handle = None
         self.pixels = None
         self.wavelength = None
         self.serial_number = None
         self.measconfig = None
-        
+        self._roi = slice(_WL_LO, _WL_HI)
+        self._n_roi = _WL_HI - _WL_LO
+        self._wavelength_trimmed = None
+        self._spec_buf = None
+        self._spec_view = None
+        self._ring = None
+        self._cb_func = None
+        self._fig = None
+        self._ax = None
+        self._line = None
+        self._bg = None
+        self._dirty = False
+        self._raw_devinfo = None
+
     def init(self):
         """
         Initialize and configure the Avantes spectrometer.
@@ -48,21 +117,22 @@ class AvantesSpectrometer:
         """
         # Initialize AVS library
         ret = AVS_Init(0)    
-        print(f"AVS_Init returned: {ret}")
+        log.info("AVS_Init returned: %s", ret)
         
         # Get number of devices
         ret = AVS_GetNrOfDevices()
-        print(f"AVS_GetNrOfDevices returned: {ret}")
+        log.info("AVS_GetNrOfDevices returned: %s", ret)
         
         # Get device list and activate first device
         mylist = AVS_GetList(1)
-        self.serial_number = str(mylist[0].SerialNumber.decode("utf-8"))
-        print(f"Found Serial number: {self.serial_number}")
+        self._raw_devinfo = mylist[0]
+        self.serial_number = mylist[0].SerialNumber.decode("utf-8")
+        log.info("Found Serial number: %s", self.serial_number)
         
         # Activate device
         globals.dev_handle = AVS_Activate(mylist[0])
         self.dev_handle = globals.dev_handle
-        print(f"AVS_Activate returned: {self.dev_handle}")
+        log.info("AVS_Activate returned: %s", self.dev_handle)
         
         # Get device configuration
         devcon = AVS_GetParameter(self.dev_handle, 63484)
@@ -72,45 +142,174 @@ class AvantesSpectrometer:
         # Get wavelength calibration
         globals.wavelength = AVS_GetLambda(self.dev_handle)
         self.wavelength = globals.wavelength
-        
+
+        # Derive the trimmed range from the wavelength calibration instead
+        # of assuming a fixed detector layout, then cache the trimmed axis
+        # and reusable spectrum buffers sized to it
+        wl = np.asarray(self.wavelength, dtype=np.float64)
+        lo = int(np.searchsorted(wl, _WL_LO_NM))
+        hi = int(np.searchsorted(wl, _WL_HI_NM))
+        # Build the slice from plain ints: np.int64 bounds (as returned
+        # by searchsorted) would push every later slice off NumPy's
+        # typed fast path
+        self._roi = slice(int(lo), int(hi), None)
+        self._n_roi = hi - lo
+        self._wavelength_trimmed = wl[self._roi].copy()
+        self._spec_buf = np.empty(self._n_roi, dtype=self._dtype)
+        self._spec_view = self._spec_buf[:]
+        self._spec_view.flags.writeable = False
+        self._ring = [np.empty(self._n_roi, dtype=self._dtype) for _ in range(4)]
+
         # Enable high resolution ADC
         ret = AVS_UseHighResAdc(self.dev_handle, True)
         
         # Configure measurement settings
         self.measconfig = self._create_measurement_config()
         ret = AVS_PrepareMeasure(self.dev_handle, self.measconfig)
-        
+        self._dirty = False
+
         return self.measconfig, self.serial_number
-    
+
+    def reconnect(self):
+        """
+        Re-activate the device using the cached enumeration record.
+
+        Skips the AVS_Init/AVS_GetNrOfDevices/AVS_GetList USB enumeration
+        that init() performs (~100-500 ms) by re-activating the device
+        info cached from the first init(). Falls back to a full init()
+        if no device has been enumerated yet.
+
+        Returns:
+            Device handle of the re-activated spectrometer
+        """
+        if self._raw_devinfo is None:
+            self.init()
+            return self.dev_handle
+
+        globals.dev_handle = AVS_Activate(self._raw_devinfo)
+        self.dev_handle = globals.dev_handle
+        log.info("AVS_Activate returned: %s", self.dev_handle)
+
+        # Per-handle state: without this the fresh handle reverts to the
+        # 14-bit ADC and changes the intensity scale of every spectrum
+        ret = AVS_UseHighResAdc(self.dev_handle, True)
+
+        # Push the existing measurement configuration to the fresh handle
+        if self.measconfig is not None:
+            ret = AVS_PrepareMeasure(self.dev_handle, self.measconfig)
+            self._dirty = False
+
+        return self.dev_handle
+
     def _create_measurement_config(self):
         """
         Create default measurement configuration.
-        
+
+        Copies the module-level template with one memcpy and patches the
+        device-dependent stop pixel.
+
         Returns:
             MeasConfigType: Configured measurement settings
         """
         measconfig = MeasConfigType()
-        measconfig.m_StartPixel = 0
+        ctypes.memmove(ctypes.addressof(measconfig),
+                       ctypes.addressof(_DEFAULT_MEASCONFIG),
+                       ctypes.sizeof(MeasConfigType))
         measconfig.m_StopPixel = self.pixels - 1
-        measconfig.m_IntegrationTime = 0.022  # Initial integration time (ms)
-        measconfig.m_IntegrationDelay = 0
-        measconfig.m_NrAverages = 200  # Default number of averages
-        measconfig.m_CorDynDark_m_Enable = 0
-        measconfig.m_CorDynDark_m_ForgetPercentage = 0
-        measconfig.m_Smoothing_m_SmoothPix = 0
-        measconfig.m_Smoothing_m_SmoothModel = 0
-        measconfig.m_SaturationDetection = 0
-        measconfig.m_Trigger_m_Mode = 0
-        measconfig.m_Trigger_m_Source = 0
-        measconfig.m_Trigger_m_SourceType = 0
-        measconfig.m_Control_m_StrobeControl = 0
-        measconfig.m_Control_m_LaserDelay = 0
-        measconfig.m_Control_m_LaserWidth = 0
-        measconfig.m_Control_m_LaserWaveLength = 0.0
-        measconfig.m_Control_m_StoreToRam = 0
-        
+
         return measconfig
     
+    @staticmethod
+    def _as_float64(spectral_data):
+        """
+        Convert raw scope data to a float64 ndarray without extra copies.
+
+        A ctypes double array from the SDK is wrapped zero-copy with
+        np.frombuffer; a plain Python sequence goes through np.fromiter,
+        which avoids the intermediate list that np.array(list) would build.
+
+        Args:
+            spectral_data: Raw data as returned by AVS_GetScopeData
+
+        Returns:
+            np.ndarray: float64 view or array over the full detector range
+        """
+        if isinstance(spectral_data, ctypes.Array) and spectral_data._type_ is ctypes.c_double:
+            return np.frombuffer(spectral_data, dtype=np.float64)
+        if isinstance(spectral_data, np.ndarray):
+            return np.asarray(spectral_data, dtype=np.float64)
+        return np.fromiter(spectral_data, dtype=np.float64, count=len(spectral_data))
+
+    def _wait_for_data(self, measconfig):
+        """
+        Wait for the current measurement to complete.
+
+        Uses hybrid polling: sleep in short intervals while completion is
+        still far off, then spin once the expected integration time has
+        nearly elapsed. This avoids the 1-15 ms overshoot of a fixed
+        1 ms sleep, which dominates wall-clock time for short integrations.
+        If the scan runs well past the expected time (e.g. the device is
+        armed on an external trigger), fall back to sleeping so a long
+        wait does not pin a core.
+
+        Args:
+            measconfig: Measurement configuration used for the expected time
+        """
+        expected_s = (measconfig.m_IntegrationTime * measconfig.m_NrAverages) / 1000.0
+        deadline = time.monotonic() + expected_s
+        # Spin only inside the window around the expected completion;
+        # past twice the expected time the scan is waiting on something
+        # else (typically a trigger) and sleeping resumes
+        overdue = deadline + max(expected_s, 0.002)
+        while not AVS_PollScan(self.dev_handle):
+            now = time.monotonic()
+            if now < deadline - 0.002 or now > overdue:
+                time.sleep(0.0005)
+
+    def _apply_config(self, measconfig):
+        """
+        Defer or push a configuration change made by a setter.
+
+        Changes to self.measconfig are batched behind the dirty flag and
+        pushed by the next commit(). An explicitly passed external config
+        keeps the original immediate AVS_PrepareMeasure semantics, since
+        commit() only ever pushes self.measconfig.
+
+        Args:
+            measconfig: The configuration the setter mutated
+        """
+        if measconfig is self.measconfig:
+            self._dirty = True
+        else:
+            ret = AVS_PrepareMeasure(self.dev_handle, measconfig)
+
+    def commit(self):
+        """
+        Apply any pending configuration changes to the device.
+
+        The set_* methods only mutate the measurement configuration in
+        memory; this method performs the single AVS_PrepareMeasure call
+        (one USB round-trip) that pushes them to the device. Called
+        automatically at the start of a measurement if needed.
+        """
+        if self._dirty:
+            ret = AVS_PrepareMeasure(self.dev_handle, self.measconfig)
+            self._dirty = False
+
+    def configure(self):
+        """
+        Context manager that batches setter calls into one device commit.
+
+        Usage:
+            with spec.configure():
+                spec.set_integration_time(0.05)
+                spec.set_scan_averages(200)
+
+        Returns:
+            _ConfigContext: Context manager committing on exit
+        """
+        return _ConfigContext(self)
+
     def wavelengths(self):
         """
         Get wavelength calibration data.
@@ -120,8 +319,7 @@ class AvantesSpectrometer:
                 - full_wavelength_array: Complete wavelength calibration
                 - trimmed_numpy_array: Numpy array for ~380-1100 nm range
         """
-        wavelength = AVS_GetLambda(self.dev_handle)
-        return wavelength, np.array(wavelength[395:1660])
+        return self.wavelength, self._wavelength_trimmed
     
     def measure_timing(self, measconfig=None):
         """
@@ -135,80 +333,363 @@ class AvantesSpectrometer:
         """
         if measconfig is None:
             measconfig = self.measconfig
-            
-        nummeas = 1
-        scans = 0
-        stopscanning = False
-        
-        while not stopscanning:
-            t1 = time.time()
-            
-            # Start measurement
-            ret = AVS_Measure(self.dev_handle, 0, 1)
-            
-            # Poll for data ready
-            dataready = False
-            while not dataready:
-                dataready = AVS_PollScan(self.dev_handle)
-                time.sleep(0.001)
-            
-            if dataready:
-                scans += 1
-                
-            if scans >= nummeas:
-                stopscanning = True
-                
-            # Get spectral data
-            ret = AVS_GetScopeData(self.dev_handle)
-            t2 = time.time()
-            t_dif = t2 - t1
-            
-            timestamp = ret[0]
-            spectral_data = ret[1]
-            
-            # Calculate timing difference
-            total_int_time = measconfig.m_IntegrationTime * measconfig.m_NrAverages
-            net_dif = (t_dif * 1000) - total_int_time
-            
-        return timestamp, np.array(spectral_data[395:1660]), net_dif, t_dif
+        self.commit()
+
+        t1 = time.perf_counter_ns()
+
+        # Start measurement
+        ret = AVS_Measure(self.dev_handle, 0, 1)
+
+        # Wait for data ready
+        self._wait_for_data(measconfig)
+
+        # Get spectral data
+        ret = AVS_GetScopeData(self.dev_handle)
+        t2 = time.perf_counter_ns()
+        t_dif = (t2 - t1) / 1e9
+
+        timestamp = ret[0]
+        spectral_data = ret[1]
+
+        # Calculate timing difference
+        total_int_time = measconfig.m_IntegrationTime * measconfig.m_NrAverages
+        net_dif = (t_dif * 1000) - total_int_time
+
+        np.copyto(self._spec_buf, self._as_float64(spectral_data)[self._roi])
+
+        return timestamp, self._spec_buf.copy(), net_dif, t_dif
     
-    def measure(self):
+    def measure_view(self):
         """
-        Perform a single measurement and return spectral data.
-        
+        Perform a single measurement and return a read-only view.
+
+        The returned array is a zero-copy view of the reusable internal
+        buffer and is overwritten by the next measurement. Suitable for
+        callers that only read the data immediately (plotting, writing
+        to disk); use measure() for a private copy.
+
         Returns:
-            tuple: (timestamp, spectral_data_array)
+            tuple: (timestamp, read-only spectral_data view)
         """
+        self.commit()
+
         # Start measurement
         ret = AVS_Measure(self.dev_handle, 0, 1)
-        
+
         # Wait for data ready
-        dataready = False
-        while not dataready:
-            dataready = AVS_PollScan(self.dev_handle)
-            time.sleep(0.001)
-        
+        self._wait_for_data(self.measconfig)
+
         # Get spectral data
         ret = AVS_GetScopeData(self.dev_handle)
         timestamp = ret[0]
         spectral_data = ret[1]
-        
-        return timestamp, np.array(spectral_data[395:1660])
+
+        # Convert once to a typed float64 array and copy the trimmed range
+        # into the reusable buffer allocated in init()
+        np.copyto(self._spec_buf, self._as_float64(spectral_data)[self._roi])
+
+        return timestamp, self._spec_view
+
+    def measure(self):
+        """
+        Perform a single measurement and return spectral data.
+
+        Returns:
+            tuple: (timestamp, spectral_data_array) - the array is a
+                private copy, safe to keep across measurements
+        """
+        timestamp, spec = self.measure_view()
+        return timestamp, spec.copy()
     
+    def measure_stream(self, nummeas):
+        """
+        Acquire a series of spectra with pipelined acquisition.
+
+        Measurements are armed via AVS_MeasureCallback, so the device
+        integrates the next spectrum while Python converts and yields the
+        previous one. Spectra are written into a small ring of preallocated
+        buffers; each yielded array is reused after len(ring) further
+        iterations, so copy it if it must outlive the loop body.
+
+        Args:
+            nummeas: Number of spectra to acquire (-1 for continuous)
+
+        Yields:
+            tuple: (timestamp, spectral_data_array) per completed measurement
+        """
+        self.commit()
+
+        done_queue = queue.Queue(maxsize=len(self._ring))
+
+        def _on_measurement(p_handle, p_status):
+            # Never block the SDK's dispatch thread in Python: dropping a
+            # completion on overrun is harmless, AVS_GetScopeData simply
+            # re-reads the latest scan on the next get()
+            try:
+                done_queue.put_nowait(p_status[0])
+            except queue.Full:
+                pass
+
+        # Keep a reference so the ctypes callback is not garbage collected
+        self._cb_func = AVS_MeasureCallbackFunc(_on_measurement)
+        ret = AVS_MeasureCallback(self.dev_handle, self._cb_func, nummeas)
+
+        i = 0
+        try:
+            while nummeas < 0 or i < nummeas:
+                status = done_queue.get()
+                if status < 0:
+                    raise RuntimeError(
+                        f"AVS measurement callback reported error {status}")
+                ret = AVS_GetScopeData(self.dev_handle)
+                timestamp = ret[0]
+                buf = self._ring[i % len(self._ring)]
+                np.copyto(buf, self._as_float64(ret[1])[self._roi])
+                i += 1
+                yield timestamp, buf
+        finally:
+            # Stop the measurement and detach the callback so the SDK
+            # thread does not keep firing into the bounded queue after
+            # the generator is closed early (notably with nummeas=-1)
+            AVS_StopMeasure(self.dev_handle)
+            AVS_MeasureCallback(self.dev_handle, None, 0)
+            self._cb_func = None
+
+    def measure_stream_threaded(self, nummeas):
+        """
+        Acquire spectra from a background thread, overlapping the device
+        wait with processing on the caller's thread.
+
+        ctypes releases the GIL for the duration of each foreign AVS_*
+        call, so the worker's measure/poll/read cycle runs in parallel
+        with NumPy post-processing of the previous spectrum on the main
+        thread. Useful where the SDK lacks AVS_MeasureCallback support;
+        otherwise prefer measure_stream(). As with measure_stream(), each
+        yielded array comes from the preallocated ring and is eventually
+        reused, so copy it if it must outlive the loop body.
+
+        Args:
+            nummeas: Number of spectra to acquire
+
+        Yields:
+            tuple: (timestamp, spectral_data_array) per completed measurement
+        """
+        self.commit()
+
+        # Bound outstanding buffers so the worker never overwrites a ring
+        # slot still queued or held by the consumer
+        results = queue.Queue(maxsize=len(self._ring) - 2)
+        stop = threading.Event()
+
+        def _put(item):
+            # Bounded put that gives up once the consumer has gone away,
+            # so the worker can never block forever on a full queue
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def _acquire():
+            # Always deliver a terminator - the sentinel or the exception
+            # itself - so the consumer can never block forever on get()
+            try:
+                for i in range(nummeas):
+                    if stop.is_set():
+                        return
+                    AVS_Measure(self.dev_handle, 0, 1)
+                    self._wait_for_data(self.measconfig)
+                    ret = AVS_GetScopeData(self.dev_handle)
+                    buf = self._ring[i % len(self._ring)]
+                    np.copyto(buf, self._as_float64(ret[1])[self._roi])
+                    _put((ret[0], buf))
+            except Exception as exc:
+                _put(exc)
+            else:
+                _put(None)
+
+        worker = threading.Thread(target=_acquire, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Unblock and retire the worker on any exit, including the
+            # caller closing the generator early
+            stop.set()
+            while True:
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    break
+            worker.join()
+
+    def measure_raw_averaged(self, n):
+        """
+        Average n single measurements on the host instead of the device.
+
+        Device-side averaging (m_NrAverages) blocks Python for the full
+        n x integration time. m_NrAverages is forced to 1 for the
+        duration of this call (and restored afterwards), so each device
+        round-trip is a single fast exposure accumulated here with
+        np.add, letting the split between device and host averaging be
+        tuned experimentally.
+
+        Args:
+            n: Number of single exposures to accumulate
+
+        Returns:
+            tuple: (timestamp, averaged_spectrum) - timestamp of the last
+                measurement and the float64 mean spectrum
+        """
+        saved_averages = self.measconfig.m_NrAverages
+        self.measconfig.m_NrAverages = 1
+        self._dirty = True
+
+        acc = np.zeros(self._n_roi, dtype=np.float64)
+        timestamp = None
+        try:
+            for _ in range(n):
+                timestamp, spec = self.measure_view()
+                np.add(acc, spec, out=acc)
+        finally:
+            self.measconfig.m_NrAverages = saved_averages
+            self._dirty = True
+
+        acc *= 1.0 / n
+        return timestamp, acc
+
+    def acquire_series(self, n, dtype=None):
+        """
+        Acquire n spectra into a preallocated 2D array.
+
+        Fills a row-contiguous (n, n_pixels) buffer row by row, giving
+        O(n) total allocation instead of the O(n^2) copying of repeated
+        pd.concat or list-append-then-np.array patterns. The C-ordered
+        layout keeps per-wavelength reductions across time fast, and the
+        result wraps directly into a DataFrame without copying.
+
+        Args:
+            n: Number of spectra to acquire
+            dtype: Storage dtype of the series array (defaults to the
+                instance's spectrum dtype)
+
+        Returns:
+            tuple: (timestamps, data) - (n,) float64 timestamps and an
+                (n, n_pixels) spectrum array
+        """
+        if dtype is None:
+            dtype = self._dtype
+        data = np.empty((n, self._n_roi), dtype=dtype)
+        timestamps = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            ts, spec = self.measure_view()
+            timestamps[i] = ts
+            data[i] = spec
+        return timestamps, data
+
+    def measure_absorbance(self, ref, baseline=None, out=None):
+        """
+        Acquire a spectrum and return its baseline-corrected absorbance.
+
+        Post-processing runs through spec_echem.kernels.postprocess,
+        which fuses the baseline subtraction, division, and log into a
+        single pass when numba is installed.
+
+        Args:
+            ref: Reference (blank) spectrum I0
+            baseline: Optional dark/baseline spectrum (zeros if None)
+            out: Optional preallocated output array (reused, not allocated)
+
+        Returns:
+            tuple: (timestamp, absorbance_spectrum)
+        """
+        timestamp, spec = self.measure_view()
+        if baseline is None:
+            baseline = np.zeros_like(spec)
+        return timestamp, kernels.postprocess(spec, ref, baseline, out=out)
+
+    @staticmethod
+    def transmittance(ref, sample, out=None):
+        """
+        Compute transmittance T = I / I0 across the spectrum.
+
+        Args:
+            ref: Reference (blank) spectrum I0
+            sample: Sample spectrum I
+            out: Optional preallocated output array (reused, not allocated)
+
+        Returns:
+            np.ndarray: Transmittance spectrum
+        """
+        if out is None:
+            out = np.empty_like(sample)
+        np.divide(sample, ref, out=out)
+        return out
+
+    @staticmethod
+    def absorbance(ref, sample, out=None):
+        """
+        Compute absorbance A = -log10(I / I0) across the spectrum.
+
+        Runs entirely in NumPy ufuncs over the trimmed arrays; passing
+        out= makes the whole computation allocation-free, suitable for
+        per-spectrum use in acquisition loops.
+
+        Args:
+            ref: Reference (blank) spectrum I0
+            sample: Sample spectrum I
+            out: Optional preallocated output array (reused, not allocated)
+
+        Returns:
+            np.ndarray: Absorbance spectrum
+        """
+        if out is None:
+            out = np.empty_like(sample)
+        np.divide(sample, ref, out=out)
+        np.log10(out, out=out)
+        np.negative(out, out=out)
+        return out
+
     def plot_data(self, wavelength, spectral_data):
         """
-        Plot spectral data.
-        
+        Plot spectral data, reusing one figure for streaming updates.
+
+        The first call creates the figure and line; subsequent calls only
+        update the line's y-data and blit the changed region, avoiding a
+        full figure rebuild and redraw per spectrum.
+
         Args:
             wavelength: Wavelength array
             spectral_data: Intensity array
         """
-        plt.plot(wavelength, spectral_data)
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Intensity')
-        plt.title('Avantes Spectrum')
-        plt.grid(True, alpha=0.3)
-        plt.show()
+        # Imported lazily: pulling in matplotlib (and its backend
+        # detection) at module import would slow down automated data
+        # collection that never plots
+        import matplotlib.pyplot as plt
+
+        if self._line is None:
+            self._fig, self._ax = plt.subplots()
+            self._line, = self._ax.plot(wavelength, spectral_data)
+            self._ax.set_xlabel('Wavelength (nm)')
+            self._ax.set_ylabel('Intensity')
+            self._ax.set_title('Avantes Spectrum')
+            self._ax.grid(True, alpha=0.3)
+            plt.show(block=False)
+            self._fig.canvas.draw()
+            self._bg = self._fig.canvas.copy_from_bbox(self._ax.bbox)
+        else:
+            self._line.set_ydata(spectral_data)
+            self._fig.canvas.restore_region(self._bg)
+            self._ax.draw_artist(self._line)
+            self._fig.canvas.blit(self._ax.bbox)
+            self._fig.canvas.flush_events()
     
     def set_integration_time(self, duration, measconfig=None):
         """
@@ -222,8 +703,8 @@ class AvantesSpectrometer:
             measconfig = self.measconfig
             
         measconfig.m_IntegrationTime = duration
-        ret = AVS_PrepareMeasure(self.dev_handle, measconfig)
-        print(f"Integration time set to {duration} ms")
+        self._apply_config(measconfig)
+        log.debug("Integration time set to %s ms", duration)
     
     def set_trigger_mode(self, mode, measconfig=None):
         """
@@ -237,9 +718,9 @@ class AvantesSpectrometer:
             measconfig = self.measconfig
             
         measconfig.m_Trigger_m_Mode = mode
-        ret = AVS_PrepareMeasure(self.dev_handle, measconfig)
+        self._apply_config(measconfig)
         mode_str = "No trigger" if mode == 0 else "Edge trigger"
-        print(f"Trigger mode set to: {mode_str}")
+        log.debug("Trigger mode set to: %s", mode_str)
     
     def set_source_type(self, mode, measconfig=None):
         """
@@ -253,9 +734,9 @@ class AvantesSpectrometer:
             measconfig = self.measconfig
             
         measconfig.m_Trigger_m_SourceType = mode
-        ret = AVS_PrepareMeasure(self.dev_handle, measconfig)
+        self._apply_config(measconfig)
         mode_str = "Edge trigger" if mode == 0 else "Level trigger"
-        print(f"Source type set to: {mode_str}")
+        log.debug("Source type set to: %s", mode_str)
     
     def set_scan_averages(self, scans, measconfig=None):
         """
@@ -269,14 +750,14 @@ class AvantesSpectrometer:
             measconfig = self.measconfig
             
         measconfig.m_NrAverages = scans
-        ret = AVS_PrepareMeasure(self.dev_handle, measconfig)
-        print(f"Number of averages set to {scans}")
+        self._apply_config(measconfig)
+        log.debug("Number of averages set to %s", scans)
     
     def close(self):
         """Close the connection to the spectrometer."""
         if self.dev_handle:
             # Add any cleanup code here
-            print("Spectrometer connection closed")
+            log.info("Spectrometer connection closed")
     
     def __enter__(self):
         """Context manager entry."""
@@ -284,4 +765,18 @@ class AvantesSpectrometer:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+class _ConfigContext:
+    """Context manager returned by AvantesSpectrometer.configure()."""
+
+    def __init__(self, spectrometer):
+        self._spectrometer = spectrometer
+
+    def __enter__(self):
+        return self._spectrometer
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._spectrometer.commit()
\ No newline at end of file